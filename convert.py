@@ -23,7 +23,7 @@ metin işleme teknikleri kullanılarak İngilizce-Türkçe terim çiftlerine ayr
 
 Dönüştürme Süreci:
 -----------------
-1. PDF Okuma: pdfplumber kütüphanesi ile sayfa sayfa metin çıkarımı
+1. PDF Okuma: pdfplumber (veya daha hızlı PDFium) ile paralel süreçlerde sayfa sayfa metin çıkarımı
 2. Metin Temizleme: Gereksiz başlıklar, semboller ve formatlamaların temizlenmesi
 3. Terim Ayrıştırma: ' : ' ayracı kullanılarak İngilizce-Türkçe çiftlerinin tespiti
 4. Veri Doğrulama: Uzunluk kontrolü ve boş değer filtreleme
@@ -59,7 +59,7 @@ into English-Turkish term pairs using regular expressions and text processing te
 
 Conversion Process:
 ------------------
-1. PDF Reading: Page-by-page text extraction using pdfplumber library
+1. PDF Reading: Page-by-page text extraction using pdfplumber (or the faster PDFium), in parallel processes
 2. Text Cleaning: Removal of unnecessary headers, symbols, and formatting
 3. Term Parsing: Detection of English-Turkish pairs using ' : ' separator
 4. Data Validation: Length checking and empty value filtering
@@ -80,10 +80,21 @@ Use Cases:
 
 """
 import pdfplumber
+import pypdfium2 as pdfium
+import argparse
+import io
 import json
 import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
 
 
 # Configure logging
@@ -94,14 +105,181 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Text extraction backends: pdfplumber is the reference output, PDFium is a
+# much faster C++ extractor that lays out a few superscript lines differently
+BACKENDS = ('pdfplumber', 'pdfium')
+
+# Consecutive pages without terms, after the first page with terms, that are
+# taken as the start of the back matter
+MAX_TRAILING_EMPTY_PAGES = 5
+
+# PDF handle and backend of the current worker process, set by _init_worker
+_worker_pdf = None
+_worker_backend = 'pdfplumber'
+
+
+def _parse_lines(lines: List[str]) -> List[Tuple[str, str]]:
+    """
+    TR: Metin satırlarını toplu olarak İngilizce-Türkçe terim çiftlerine ayırır.
+    EN: Split a batch of text lines into English-Turkish term pairs.
+    
+    Args:
+        lines: TR: PDF'den çıkarılan satırlar / EN: Lines extracted from the PDF
+        
+    Returns:
+        TR: (İngilizce, Türkçe) çiftlerinin listesi
+        EN: List of (English, Turkish) pairs
+    """
+    pairs = []
+
+    # Only lines carrying the " : " separator can hold a term; drop the rest
+    # (headers, blank lines, wrapped text) in a single pass up front
+    candidates = [line for line in lines if ' : ' in line]
+
+    for line in candidates:
+        # Skip headers and unnecessary lines. ':' is one of the header tokens
+        # and every candidate contains ' : ', so the token scan always hits and
+        # the check reduces to the colon count alone
+        if line.count(':') > 2:
+            continue
+
+        english, _, turkish = line.partition(' : ')
+        english = english.strip()
+        turkish = turkish.strip()
+
+        # Cleanup
+        if english and turkish and len(english) < 200 and len(turkish) < 200:
+            pairs.append((english, turkish))
+
+    return pairs
+
+
+def _open_pdf(pdf_path: str, backend: str):
+    """
+    TR: PDF dosyasını seçilen arka uçla açar.
+    EN: Open the PDF with the selected backend.
+    
+    Args:
+        pdf_path: TR: PDF dosyasının yolu / EN: Path to PDF file
+        backend: TR: Metin çıkarım arka ucu / EN: Text extraction backend
+        
+    Returns:
+        TR: Açık PDF belgesi
+        EN: Open PDF document
+    """
+    # Read the whole file with one sequential read and parse it from memory,
+    # so the parsers' many small seeks and reads never reach the disk
+    data = Path(pdf_path).read_bytes()
+    if backend == 'pdfium':
+        return pdfium.PdfDocument(data)
+    # laparams=None keeps pdfplumber on its own char clustering; passing
+    # LAParams would add pdfminer's layout analysis on top, which is slower
+    return pdfplumber.open(io.BytesIO(data), laparams=None)
+
+
+def _page_count(pdf, backend: str) -> int:
+    """
+    TR: Açık PDF belgesinin sayfa sayısını döndürür.
+    EN: Return the page count of an open PDF document.
+    
+    Args:
+        pdf: TR: Açık PDF belgesi / EN: Open PDF document
+        backend: TR: Metin çıkarım arka ucu / EN: Text extraction backend
+        
+    Returns:
+        TR: Sayfa sayısı
+        EN: Number of pages
+    """
+    if backend == 'pdfium':
+        return len(pdf)
+    return len(pdf.pages)
+
+
+def _page_text(pdf, backend: str, page_index: int) -> str:
+    """
+    TR: Tek bir sayfanın metnini seçilen arka uçla çıkarır.
+    EN: Extract the text of a single page with the selected backend.
+    
+    Args:
+        pdf: TR: Açık PDF belgesi / EN: Open PDF document
+        backend: TR: Metin çıkarım arka ucu / EN: Text extraction backend
+        page_index: TR: Sıfır tabanlı sayfa numarası / EN: Zero-based page index
+        
+    Returns:
+        TR: Satırları yeni satır karakteriyle ayrılmış sayfa metni
+        EN: Page text with newline-separated lines
+    """
+    if backend == 'pdfium':
+        page = pdf[page_index]
+        textpage = page.get_textpage()
+        text = textpage.get_text_range()
+        textpage.close()
+        page.close()
+        # PDFium breaks lines with CRLF and marks a line-end hyphen as U+FFFE
+        return text.replace('\ufffe', '-\n').replace('\r\n', '\n')
+
+    page = pdf.pages[page_index]
+    text = page.extract_text()
+    # The shared handle would otherwise keep every page's parsed chars alive
+    page.close()
+    return text
+
+
+def _init_worker(pdf_path: str, backend: str):
+    """
+    TR: Çalışan süreçte PDF dosyasını bir kez açar.
+    EN: Open the PDF once per worker process.
+    
+    Args:
+        pdf_path: TR: PDF dosyasının yolu / EN: Path to PDF file
+        backend: TR: Metin çıkarım arka ucu / EN: Text extraction backend
+    """
+    # Opening is expensive (pdfplumber walks the whole page tree), so each
+    # worker keeps its own handle for every page it is assigned
+    global _worker_pdf, _worker_backend
+    _worker_pdf = _open_pdf(pdf_path, backend)
+    _worker_backend = backend
+
 
-def parse_tbd_dictionary(pdf_path: str) -> List[Dict[str, str]]:
+def _extract_page(page_index: int) -> List[Tuple[str, str]]:
+    """
+    TR: Tek bir PDF sayfasının metnini çıkarır ve terim çiftlerine ayırır.
+    EN: Extract the text of a single PDF page and split it into term pairs.
+    
+    Args:
+        page_index: TR: Sıfır tabanlı sayfa numarası / EN: Zero-based page index
+        
+    Returns:
+        TR: Sayfadaki (İngilizce, Türkçe) çiftleri
+        EN: (English, Turkish) pairs found on the page
+    """
+    text = _page_text(_worker_pdf, _worker_backend, page_index)
+
+    # Cover, contents and appendix pages carry no separator at all
+    if not text or ' : ' not in text:
+        return []
+
+    return _parse_lines(text.split('\n'))
+
+
+def parse_tbd_dictionary(
+    pdf_path: str,
+    backend: str = 'pdfplumber',
+    max_workers: Optional[int] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None
+) -> List[Dict[str, str]]:
     """
     TR: TBD sözlük PDF dosyasını ayrıştırır ve terimleri çıkarır.
     EN: Parse TBD dictionary PDF and extract terms.
     
     Args:
         pdf_path: TR: PDF dosyasının yolu / EN: Path to PDF file
+        backend: TR: Metin çıkarım arka ucu (pdfplumber/pdfium) / EN: Text extraction backend
+        max_workers: TR: Paralel işlem sayısı (varsayılan: CPU sayısı)
+                     EN: Number of worker processes (default: CPU count)
+        first_page: TR: İşlenecek ilk sayfa (1 tabanlı) / EN: First page to process (1-based)
+        last_page: TR: İşlenecek son sayfa (1 tabanlı) / EN: Last page to process (1-based)
         
     Returns:
         TR: İngilizce-Türkçe terim çiftlerinin listesi
@@ -109,45 +287,94 @@ def parse_tbd_dictionary(pdf_path: str) -> List[Dict[str, str]]:
     """
     term_list = []
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_num, page in enumerate(pdf.pages):
-            logger.info(f"Processing page {page_num + 1}...")
-
-            text = page.extract_text()
-            if not text:
-                continue
-
-            # Split into lines
-            lines = text.split('\n')
-
-            for line in lines:
-                # Skip headers and unnecessary lines
-                if any(skip in line for skip in ['English', 'Türkçe', 'terms', 'Symbols', 'Numbers', ':', '--']):
-                    if ' : ' not in line or line.count(':') > 2:
-                        continue
-
-                # Skip empty lines
-                if not line.strip():
-                    continue
-
-                # Find terms separated by " : "
-                if ' : ' in line:
-                    parts = line.split(' : ', 1)
-                    if len(parts) == 2:
-                        english = parts[0].strip()
-                        turkish = parts[1].strip()
-
-                        # Cleanup
-                        if english and turkish and len(english) < 200 and len(turkish) < 200:
-                            term_list.append({
-                                'en': english,
-                                'tr': turkish
-                            })
+    # Workers send back a fresh copy of every string; identical terms and
+    # translations are collapsed onto one object as the results arrive
+    cache: Dict[str, str] = {}
+
+    pdf = _open_pdf(pdf_path, backend)
+    try:
+        n_pages = _page_count(pdf, backend)
+    finally:
+        pdf.close()
+
+    first_page = 1 if first_page is None else first_page
+    last_page = n_pages if last_page is None else min(last_page, n_pages)
+    if first_page < 1 or first_page > last_page:
+        raise ValueError(f"Invalid page range {first_page}-{last_page} for a {n_pages} page PDF")
+
+    # Known front/back matter can be skipped entirely with the page bounds
+    page_indices = range(first_page - 1, last_page)
+
+    # Pages are independent, so extraction fans out across processes; map()
+    # keeps the results in page order and chunking amortizes the IPC cost
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(page_indices) // (workers * 4))
+
+    seen_terms = False
+    empty_run = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_path, backend)) as executor:
+        pages = executor.map(_extract_page, page_indices, chunksize=chunksize)
+        for page_index, pairs in zip(page_indices, pages):
+            logger.info(f"Processing page {page_index + 1}...")
+
+            if pairs:
+                seen_terms = True
+                empty_run = 0
+            elif seen_terms:
+                # A run of term-less pages after the dictionary body is the
+                # appendix; stop instead of extracting the rest of it
+                empty_run += 1
+                if empty_run >= MAX_TRAILING_EMPTY_PAGES:
+                    logger.info(f"No terms on the last {empty_run} pages, stopping at page {page_index + 1}")
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    break
+
+            term_list.extend(
+                {'en': cache.setdefault(english, english), 'tr': cache.setdefault(turkish, turkish)}
+                for english, turkish in pairs
+            )
 
     return term_list
 
 
-def save_as_json(term_list: List[Dict[str, str]], output_path: Path):
+def _dumps(obj) -> bytes:
+    """
+    TR: Nesneyi sıkıştırılmış UTF-8 JSON olarak kodlar.
+    EN: Encode an object as compact UTF-8 JSON.
+    
+    Args:
+        obj: TR: Kodlanacak nesne / EN: Object to encode
+        
+    Returns:
+        TR: JSON baytları
+        EN: JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _build_metadata(term_list: List[Dict[str, str]]) -> Dict:
+    """
+    TR: Sözlük çıktısının metadata bilgilerini oluşturur.
+    EN: Build the metadata of the dictionary output.
+    
+    Args:
+        term_list: TR: Terim listesi / EN: List of terms
+        
+    Returns:
+        TR: Kaynak, toplam terim sayısı ve versiyon bilgileri
+        EN: Source, total term count and version information
+    """
+    return {
+        'source': 'TBD Bilişim Terimleri Sözlüğü',
+        'total_terms': len(term_list),
+        'version': '2025-08-04'
+    }
+
+
+def save_as_json(term_list: List[Dict[str, str]], output_path: Path, pretty: bool = False):
     """
     TR: Terimleri JSON formatında kaydeder.
     EN: Save terms as JSON format.
@@ -155,43 +382,130 @@ def save_as_json(term_list: List[Dict[str, str]], output_path: Path):
     Args:
         term_list: TR: Terim listesi / EN: List of terms
         output_path: TR: Çıktı dizini / EN: Output directory
+        pretty: TR: Girintili çıktı üret / EN: Write indented output
         
     Returns:
         TR: Oluşturulan JSON dosyasının yolu
         EN: Path to created JSON file
     """
-    output = {
-        'metadata': {
-            'source': 'TBD Bilişim Terimleri Sözlüğü',
-            'total_terms': len(term_list),
-            'version': '2025-08-04'
-        },
-        'terms': term_list
-    }
+    metadata = _build_metadata(term_list)
     
     output_file = output_path / 'tbd_dictionary.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if pretty:
+        output = {
+            'metadata': metadata,
+            'terms': term_list
+        }
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(output, f, ensure_ascii=False, indent=2)
+    else:
+        # Stream one term at a time through a 1 MiB buffer instead of
+        # materializing the whole encoded document in memory
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"metadata":' + _dumps(metadata) + b',"terms":[')
+            for i, term in enumerate(term_list):
+                if i:
+                    f.write(b',')
+                f.write(_dumps(term))
+            f.write(b']}')
     
     logger.info(f"JSON file saved: {output_file}")
     logger.info(f"Total {len(term_list)} terms saved")
     return output_file
 
 
+def save_as_pickle(term_list: List[Dict[str, str]], output_path: Path):
+    """
+    TR: Terimleri web arayüzünün hızlı açılışı için sütun yapısında pickle olarak kaydeder.
+    EN: Save terms column-wise as a pickle for fast web app start-up.
+    
+    Args:
+        term_list: TR: Terim listesi / EN: List of terms
+        output_path: TR: Çıktı dizini / EN: Output directory
+        
+    Returns:
+        TR: Oluşturulan pickle dosyasının yolu
+        EN: Path to created pickle file
+    """
+    # Same layout serve.load_database builds from the JSON, ready to use.
+    # Equal strings share one object, which pickle then stores only once
+    cache: Dict[str, str] = {}
+    en = [cache.setdefault(term['en'], term['en']) for term in term_list]
+    tr = [cache.setdefault(term['tr'], term['tr']) for term in term_list]
+    columns = {
+        'en': en,
+        'tr': tr,
+        'en_lower': [cache.setdefault(lower, lower) for lower in (text.lower() for text in en)],
+        'tr_lower': [cache.setdefault(lower, lower) for lower in (text.lower() for text in tr)],
+        'metadata': _build_metadata(term_list)
+    }
+    
+    output_file = output_path / 'tbd_dictionary.pkl'
+    with open(output_file, 'wb') as f:
+        pickle.dump(columns, f, protocol=5)
+    
+    logger.info(f"Pickle file saved: {output_file}")
+    return output_file
+
+
 # Usage
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TBD dictionary PDF to JSON converter")
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='pdfplumber',
+        help="PDF text extraction backend (pdfium is much faster, pdfplumber is the reference)"
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help="Write indented JSON instead of the compact streamed output"
+    )
+    parser.add_argument(
+        '--first-page',
+        type=int,
+        help="First page to process (1-based), e.g. to skip known front matter"
+    )
+    parser.add_argument(
+        '--last-page',
+        type=int,
+        help="Last page to process (1-based), e.g. to skip known back matter"
+    )
+    args = parser.parse_args()
+    if args.first_page is not None and args.first_page < 1:
+        parser.error("--first-page must be at least 1")
+    if args.last_page is not None and args.last_page < 1:
+        parser.error("--last-page must be at least 1")
+    if args.first_page is not None and args.last_page is not None and args.first_page > args.last_page:
+        parser.error("--first-page must not be greater than --last-page")
+
     pdf_file = "data/TBD-Bilisim-Sozlugu-Ingilizce-Turkce-2025-08-04.pdf"
     try:
         # Parse PDF
-        parsed_terms = parse_tbd_dictionary(pdf_file)
+        parsed_terms = parse_tbd_dictionary(
+            pdf_file,
+            backend=args.backend,
+            first_page=args.first_page,
+            last_page=args.last_page
+        )
+        
+        # Never replace a good dictionary with an empty one
+        if not parsed_terms:
+            logger.error("No terms extracted, existing output files left untouched")
+            parser.exit(1)
         
         # Create output directory if it doesn't exist
         output_dir = Path('output')
         output_dir.mkdir(exist_ok=True)
         
-        # Save as JSON
-        logger.info("Saving dictionary in JSON format")
-        save_as_json(parsed_terms, output_dir)
+        # Save as JSON (and the pickle the web app loads first)
+        logger.info("Saving dictionary in JSON and pickle formats")
+        save_as_json(parsed_terms, output_dir, pretty=args.pretty)
+        save_as_pickle(parsed_terms, output_dir)
         
         logger.info(f"Total {len(parsed_terms)} terms successfully converted")
 
@@ -200,6 +514,8 @@ if __name__ == "__main__":
         for i, term in enumerate(parsed_terms[:5]):
             logger.info(f"{i + 1}. {term['en']} -> {term['tr']}")
 
+    except ValueError as e:
+        parser.error(str(e))
     except Exception as e:
         logger.error(f"Error: {e}")
         logger.error("Please make sure the PDF file path is correct.")
\ No newline at end of file
@@ -73,14 +73,26 @@ User Interface Components:
 
 """
 import streamlit as st
+import bisect
+import csv
+import io
 import json
 import logging
+import pickle
 import random
+import re
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
-from rapidfuzz import fuzz, process  # type: ignore
+import numpy as np
+from rapidfuzz import fuzz, process, utils  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -98,41 +110,386 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Columns the pickle written by convert.py must provide
+PICKLE_COLUMNS = ("en", "tr", "en_lower", "tr_lower", "metadata")
+
+# Fuzzy queries shorter than this are scored against every term; they have
+# too few trigrams to narrow the candidates without losing matches
+MIN_INDEXED_QUERY = 4
+
+# Below this cutoff a term can reach the score through WRatio's partial and
+# token ratios without sharing a trigram, so lower cutoffs score every term
+MIN_INDEXED_SCORE = 80
+
+# Terms this short are always fuzzy candidates: WRatio scores them through
+# partial matching even when they share no trigram with the query
+MAX_SHORT_TERM = 3
+
 
 @st.cache_resource
-def load_database() -> Tuple[Optional[List[Dict]], Dict]:
+def load_database() -> Optional[Dict[str, Any]]:
     """
-    TR: JSON dosyasından veritabanını yükler.
-    EN: Load database from JSON file.
+    TR: Pickle (varsa) veya JSON dosyasından veritabanını yükler.
+    EN: Load database from the pickle file if present, otherwise from JSON.
     
     Returns:
-        TR: Terimler listesi ve metadata bilgileri
-        EN: Terms list and metadata information
+        TR: Terim sütunları ve metadata bilgileri
+        EN: Term columns and metadata information
     """
+    pickle_path = Path("output/tbd_dictionary.pkl")
     json_path = Path("output/tbd_dictionary.json")
     
-    terms = []
-    metadata = {}
+    columns = None
     
-    if json_path.exists():
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    # convert.py writes the pickle next to the JSON with the columns already
+    # built, which skips JSON parsing and per-term dict construction. It is
+    # written after the JSON, so an older pickle means the JSON has changed
+    if pickle_path.exists():
+        if json_path.exists() and pickle_path.stat().st_mtime < json_path.stat().st_mtime:
+            logger.warning("Pickle is older than JSON, loading JSON instead")
+        else:
+            try:
+                with open(pickle_path, 'rb') as f:
+                    columns = pickle.load(f)
+                
+                # Validate here so a pickle with another layout falls back to
+                # the JSON instead of failing in build_database
+                if not isinstance(columns, dict):
+                    raise ValueError("unexpected pickle layout")
+                missing = [key for key in PICKLE_COLUMNS if key not in columns]
+                if missing:
+                    raise ValueError(f"missing columns {missing}")
+                if len({len(columns[key]) for key in ("en", "tr", "en_lower", "tr_lower")}) != 1:
+                    raise ValueError("column lengths differ")
+                    
+                logger.info(f"Loaded {len(columns['en'])} terms from pickle")
+            except Exception as e:
+                columns = None
+                logger.error(f"Failed to load pickle: {e}")
+    
+    if columns is None:
+        if json_path.exists():
+            try:
+                if orjson is not None:
+                    data = orjson.loads(json_path.read_bytes())
+                else:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                 terms = data.get('terms', [])
-                metadata = data.get('metadata', {})
                 
-            logger.info(f"Loaded {len(terms)} terms from JSON")
-            return terms, metadata
-        except Exception as e:
-            logger.error(f"Failed to load JSON: {e}")
-    else:
-        logger.error("No JSON file found. Please run convert.py first.")
+                # Store terms column-wise; lowercased copies are computed once
+                # here instead of on every search. Translations repeat across
+                # terms and most lowercase forms equal the original, so equal
+                # strings share one object (the pickle already stores them so)
+                cache: Dict[str, str] = {}
+                en = share_strings([term["en"] for term in terms], cache)
+                tr = share_strings([term["tr"] for term in terms], cache)
+                columns = {
+                    "en": en,
+                    "tr": tr,
+                    "en_lower": share_strings([text.lower() for text in en], cache),
+                    "tr_lower": share_strings([text.lower() for text in tr], cache),
+                    "metadata": data.get('metadata', {})
+                }
+                    
+                logger.info(f"Loaded {len(en)} terms from JSON")
+            except Exception as e:
+                logger.error(f"Failed to load JSON: {e}")
+        else:
+            logger.error("No JSON file found. Please run convert.py first.")
+    
+    if columns is None:
+        return None
+    
+    return build_database(columns)
+
+
+def build_database(columns: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    TR: Terim sütunlarına arama için gereken yardımcı yapıları ekler.
+    EN: Add the derived search structures to the term columns.
+    
+    Args:
+        columns: TR: en/tr, en_lower/tr_lower ve metadata sütunları
+                 EN: en/tr, en_lower/tr_lower and metadata columns
+        
+    Returns:
+        TR: Aramaya hazır terim veritabanı
+        EN: Search-ready term database
+    """
+    en = columns["en"]
+    tr = columns["tr"]
+    en_lower = columns["en_lower"]
+    tr_lower = columns["tr_lower"]
+    
+    en_corpus, en_offsets = build_corpus(en_lower)
+    tr_corpus, tr_offsets = build_corpus(tr_lower)
+    
+    # Fuzzy choices are normalized once instead of per extract() call
+    en_choices = reuse_equal([utils.default_process(text) for text in en], en_lower)
+    tr_choices = reuse_equal([utils.default_process(text) for text in tr], tr_lower)
+    
+    return {
+        "en": en,
+        "tr": tr,
+        "en_lower": en_lower,
+        "tr_lower": tr_lower,
+        "en_corpus": en_corpus,
+        "en_offsets": en_offsets,
+        "tr_corpus": tr_corpus,
+        "tr_offsets": tr_offsets,
+        "en_exact": build_lookup(en_lower),
+        "tr_exact": build_lookup(tr_lower),
+        "en_choices": en_choices,
+        "tr_choices": tr_choices,
+        "en_trigrams": build_trigram_index(en_choices),
+        "tr_trigrams": build_trigram_index(tr_choices),
+        "en_short": np.flatnonzero([len(text) <= MAX_SHORT_TERM for text in en_choices]),
+        "tr_short": np.flatnonzero([len(text) <= MAX_SHORT_TERM for text in tr_choices]),
+        "metadata": columns["metadata"]
+    }
+
+
+def share_strings(texts: List[str], cache: Dict[str, str]) -> List[str]:
+    """
+    TR: Eşit metinlerin bellekte tek bir nesneyi paylaşmasını sağlar.
+    EN: Make equal strings share a single object in memory.
+    
+    Args:
+        texts: TR: Metin listesi / EN: List of texts
+        cache: TR: Daha önce görülen metinler / EN: Previously seen texts
+        
+    Returns:
+        TR: Aynı içerikte, tekrarları paylaşılan liste
+        EN: Same list contents with duplicates shared
+    """
+    return [cache.setdefault(text, text) for text in texts]
+
+
+def reuse_equal(texts: List[str], originals: List[str]) -> List[str]:
+    """
+    TR: Aynı sıradaki özgün metne eşit olan türetilmiş metinlerin yerine özgününü kullanır.
+    EN: Replace derived texts with the original at the same index when they are equal.
+    
+    Args:
+        texts: TR: Türetilmiş metinler / EN: Derived texts
+        originals: TR: Özgün metinler / EN: Original texts
+        
+    Returns:
+        TR: Eşit metinleri özgünüyle paylaşan liste
+        EN: List sharing equal texts with the originals
+    """
+    return [original if text == original else text for text, original in zip(texts, originals)]
+
+
+def build_lookup(texts: List[str]) -> Dict[str, List[int]]:
+    """
+    TR: Her metni, onu içeren satırların sırasına eşler.
+    EN: Map each text to the rows holding it.
+    
+    Args:
+        texts: TR: Küçük harfli metinler / EN: Lowercased texts
+        
+    Returns:
+        TR: Metinden artan satır numaralarına eşleme
+        EN: Mapping from text to ascending row indices
+    """
+    lookup = defaultdict(list)
+    for idx, text in enumerate(texts):
+        lookup[text].append(idx)
+    
+    return dict(lookup)
+
+
+def build_corpus(texts: List[str]) -> Tuple[str, List[int]]:
+    """
+    TR: Metinleri satır satır tek bir arama metninde birleştirir.
+    EN: Join texts into a single newline-separated search corpus.
+    
+    Args:
+        texts: TR: Birleştirilecek metinler / EN: Texts to join
+        
+    Returns:
+        TR: Birleşik metin ve her satırın başlangıç konumu
+        EN: Joined corpus and the start offset of each row
+    """
+    offsets = []
+    pos = 0
+    for text in texts:
+        offsets.append(pos)
+        pos += len(text) + 1
+    
+    return "\n".join(texts), offsets
+
+
+def scan_corpus(corpus: str, offsets: List[int], pattern: re.Pattern, limit: int) -> List[int]:
+    """
+    TR: Deseni birleşik metinde arar ve eşleşen satırların sırasını döndürür.
+    EN: Scan the corpus with a pattern and return the matching row indices.
+    
+    Args:
+        corpus: TR: Birleşik arama metni / EN: Joined search corpus
+        offsets: TR: Satır başlangıç konumları / EN: Row start offsets
+        pattern: TR: Derlenmiş arama deseni / EN: Compiled search pattern
+        limit: TR: Maksimum satır sayısı / EN: Maximum row count
+        
+    Returns:
+        TR: Artan sırada eşleşen satır numaraları
+        EN: Matching row indices in ascending order
+    """
+    hits = []
+    
+    # One C-level scan over the whole column; match offsets map back to rows
+    for match in pattern.finditer(corpus):
+        idx = bisect.bisect_right(offsets, match.start()) - 1
+        if hits and hits[-1] == idx:
+            continue
+        
+        hits.append(idx)
+        if len(hits) >= limit:
+            break
+    
+    return hits
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    TR: Metnin kelime sınırları doldurulmuş üçlü karakter gruplarını döndürür.
+    EN: Return the character trigrams of a text, with word boundaries padded.
+    
+    Args:
+        text: TR: İşlenmiş metin / EN: Processed text
+        
+    Returns:
+        TR: Üçlü karakter grupları
+        EN: Set of trigrams
+    """
+    # Padding gives every word edge trigrams ("  c", " cl"), so a typo inside
+    # a short word ("claud" for "cloud") still leaves shared trigrams
+    padded = "  " + text.replace(" ", "  ") + "  "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_trigram_index(texts: List[str]) -> Dict[str, np.ndarray]:
+    """
+    TR: Her üçlü karakter grubu için onu içeren metinlerin sırasını tutan dizin oluşturur.
+    EN: Build an inverted index from each trigram to the rows containing it.
+    
+    Args:
+        texts: TR: İşlenmiş metinler / EN: Processed texts
+        
+    Returns:
+        TR: Üçlü gruptan artan satır numaralarına eşleme
+        EN: Mapping from trigram to ascending row indices
+    """
+    postings = defaultdict(list)
+    for idx, text in enumerate(texts):
+        for gram in trigrams(text):
+            postings[gram].append(idx)
+    
+    return {gram: np.array(idxs, dtype=np.int32) for gram, idxs in postings.items()}
+
+
+def fuzzy_candidates(
+    query: str,
+    index: Dict[str, np.ndarray],
+    short: np.ndarray,
+    score_cutoff: float
+) -> Optional[np.ndarray]:
+    """
+    TR: Sorguyla en az bir üçlü grubu paylaşan satırları döndürür.
+    EN: Return the rows sharing at least one trigram with the query.
+    
+    Args:
+        query: TR: İşlenmiş arama sorgusu / EN: Processed search query
+        index: TR: Üçlü grup dizini / EN: Trigram index
+        short: TR: Her zaman aday olan kısa satırlar / EN: Short rows that are always candidates
+        score_cutoff: TR: Minimum benzerlik skoru / EN: Minimum similarity score
+        
+    Returns:
+        TR: Artan sırada aday satırlar; tüm satırlar taranacaksa None
+        EN: Candidate rows in ascending order, or None to scan every row
+    """
+    if len(query) < MIN_INDEXED_QUERY or score_cutoff < MIN_INDEXED_SCORE:
+        return None
     
-    return None, {}
+    # The union of the posting lists, not their intersection: a single typo
+    # removes up to three of the query's trigrams
+    postings = [index[gram] for gram in trigrams(query) if gram in index]
+    return np.unique(np.concatenate(postings + [short]))
+
+
+def fuzzy_match(
+    query: str,
+    choices: List[str],
+    limit: int,
+    score_cutoff: float = 0.0,
+    rows: Optional[np.ndarray] = None
+) -> List[Tuple[int, float]]:
+    """
+    TR: Sorguyu tüm seçeneklerle tek seferde puanlar ve en iyi eşleşmeleri döndürür.
+    EN: Score the query against all choices in one batch and return the best matches.
+    
+    Args:
+        query: TR: İşlenmiş arama sorgusu / EN: Processed search query
+        choices: TR: İşlenmiş seçenek listesi / EN: Processed choice list
+        limit: TR: Maksimum sonuç sayısı / EN: Maximum result count
+        score_cutoff: TR: Minimum benzerlik skoru / EN: Minimum similarity score
+        rows: TR: Yalnızca puanlanacak satırlar (artan) / EN: Only score these rows (ascending)
+        
+    Returns:
+        TR: (sıra, skor) çiftleri, skora göre azalan
+        EN: (index, score) pairs, best score first
+    """
+    if limit <= 0 or not choices:
+        return []
+    
+    # Score only the candidate rows; they are ascending, so ties keep the
+    # same index order as a full scan
+    if rows is not None:
+        matches = fuzzy_match(query, [choices[idx] for idx in rows], limit, score_cutoff)
+        return [(int(rows[idx]), score) for idx, score in matches]
+    
+    # cdist scores the whole column in C++ and spreads it over all cores;
+    # with score_cutoff the scorer gives up early on hopeless candidates
+    scores = process.cdist(
+        [query],
+        choices,
+        scorer=fuzz.WRatio,
+        score_cutoff=score_cutoff,
+        dtype=np.float64,
+        workers=-1
+    )[0]
+    idxs = np.flatnonzero(scores >= score_cutoff)
+    
+    # Keep every candidate tied with the limit-th best score so the order
+    # matches process.extract: score descending, then index ascending
+    if limit < len(idxs):
+        kth = np.partition(scores[idxs], -limit)[-limit]
+        idxs = idxs[scores[idxs] >= kth]
+    
+    best = idxs[np.lexsort((idxs, -scores[idxs]))][:limit]
+    return [(int(idx), float(scores[idx])) for idx in best]
+
+
+def get_term(db: Dict[str, Any], idx: int) -> Dict[str, str]:
+    """
+    TR: Verilen sıradaki terimi sözlük olarak döndürür.
+    EN: Return the term at the given index as a dict.
+    
+    Args:
+        db: TR: Terim veritabanı / EN: Term database
+        idx: TR: Terim sırası / EN: Term index
+        
+    Returns:
+        TR: "en" ve "tr" alanlarını içeren terim
+        EN: Term with "en" and "tr" fields
+    """
+    return {"en": db["en"][idx], "tr": db["tr"][idx]}
 
 
 def search_terms(
-    terms: List[Dict],
+    db: Dict[str, Any],
     query: str,
     mode: str = "fuzzy",
     lang: str = "both",
@@ -144,7 +501,7 @@ def search_terms(
     EN: Search terms with different modes.
     
     Args:
-        terms: TR: Terim listesi / EN: List of terms
+        db: TR: Terim veritabanı / EN: Term database
         query: TR: Arama sorgusu / EN: Search query
         mode: TR: Arama modu (fuzzy/exact/partial) / EN: Search mode
         lang: TR: Arama dili (both/en/tr) / EN: Search language
@@ -160,67 +517,103 @@ def search_terms(
     
     results = []
     query_lower = query.lower()
+    search_en = lang in ["en", "both"]
+    search_tr = lang in ["tr", "both"]
     
     if mode == "exact":
-        for term in terms:
-            if lang in ["en", "both"] and term["en"].lower() == query_lower:
-                results.append((term, 100.0))
-            elif lang in ["tr", "both"] and term["tr"].lower() == query_lower:
-                results.append((term, 100.0))
-            
-            if len(results) >= limit:
-                break
+        hits = set()
+        
+        # Exact matches are a hash lookup; each column maps a lowercase text
+        # to its rows in ascending order, so their union keeps row order
+        if search_en:
+            hits.update(db["en_exact"].get(query_lower, ()))
+        if search_tr:
+            hits.update(db["tr_exact"].get(query_lower, ()))
+        
+        for idx in sorted(hits)[:limit]:
+            results.append((get_term(db, idx), 100.0))
     
     elif mode == "partial":
-        for term in terms:
-            if lang in ["en", "both"] and query_lower in term["en"].lower():
-                results.append((term, None))
-            elif lang in ["tr", "both"] and query_lower in term["tr"].lower():
-                results.append((term, None))
-            
-            if len(results) >= limit:
-                break
+        pattern = re.compile(re.escape(query_lower))
+        hits = set()
+        
+        # Each column yields its first `limit` rows, so the first `limit` of
+        # their union are exactly the first `limit` rows matching either one
+        if search_en:
+            hits.update(scan_corpus(db["en_corpus"], db["en_offsets"], pattern, limit))
+        if search_tr:
+            hits.update(scan_corpus(db["tr_corpus"], db["tr_offsets"], pattern, limit))
+        
+        for idx in sorted(hits)[:limit]:
+            results.append((get_term(db, idx), None))
     
     elif mode == "fuzzy":
         candidates = []
+        query_processed = utils.default_process(query)
         
-        if lang in ["en", "both"]:
-            en_terms = [(term["en"], term) for term in terms]
-            en_matches = process.extract(  # type: ignore
-                query,
-                [t[0] for t in en_terms],
-                scorer=fuzz.WRatio,
-                limit=limit if lang == "en" else limit // 2
-            )
-            for match_text, score, idx in en_matches:
-                if score >= min_score:
-                    candidates.append((en_terms[idx][1], score))
-        
-        if lang in ["tr", "both"]:
-            tr_terms = [(term["tr"], term) for term in terms]
-            tr_matches = process.extract(  # type: ignore
-                query,
-                [t[0] for t in tr_terms],
-                scorer=fuzz.WRatio,
-                limit=limit if lang == "tr" else limit // 2
-            )
-            for match_text, score, idx in tr_matches:
-                if score >= min_score:
-                    candidates.append((tr_terms[idx][1], score))
+        if search_en:
+            candidates.extend(fuzzy_match(
+                query_processed,
+                db["en_choices"],
+                limit=limit if lang == "en" else limit // 2,
+                score_cutoff=min_score,
+                rows=fuzzy_candidates(query_processed, db["en_trigrams"], db["en_short"], min_score)
+            ))
+        
+        if search_tr:
+            candidates.extend(fuzzy_match(
+                query_processed,
+                db["tr_choices"],
+                limit=limit if lang == "tr" else limit // 2,
+                score_cutoff=min_score,
+                rows=fuzzy_candidates(query_processed, db["tr_trigrams"], db["tr_short"], min_score)
+            ))
         
         # Sort by score and remove duplicates
         seen = set()
-        for term, score in sorted(candidates, key=lambda x: x[1], reverse=True):
-            term_key = (term["en"], term["tr"])
+        for idx, score in sorted(candidates, key=lambda x: x[1], reverse=True):
+            term_key = (db["en"][idx], db["tr"][idx])
             if term_key not in seen:
                 seen.add(term_key)
-                results.append((term, score))
+                results.append((get_term(db, idx), score))
                 if len(results) >= limit:
                     break
     
     return results
 
 
+@st.cache_data(max_entries=128, ttl=3600, show_spinner=False)
+def cached_search_terms(
+    query: str,
+    mode: str = "fuzzy",
+    lang: str = "both",
+    limit: int = 10,
+    min_score: float = 60.0
+) -> List[Tuple[Dict, Optional[float]]]:
+    """
+    TR: Aynı ayarlarla tekrarlanan aramaların sonuçlarını önbellekten döndürür.
+    EN: Serve repeated searches with the same settings from the cache.
+    
+    Args:
+        query: TR: Arama sorgusu / EN: Search query
+        mode: TR: Arama modu (fuzzy/exact/partial) / EN: Search mode
+        lang: TR: Arama dili (both/en/tr) / EN: Search language
+        limit: TR: Maksimum sonuç sayısı / EN: Maximum result count
+        min_score: TR: Minimum benzerlik skoru / EN: Minimum similarity score
+        
+    Returns:
+        TR: Terim ve skor çiftlerinin listesi
+        EN: List of term and score pairs
+    """
+    # The database is a cached resource, so only the scalar arguments key
+    # this cache; every widget rerun with an unchanged query is a lookup
+    db = load_database()
+    if not db:
+        return []
+    
+    return search_terms(db, query, mode=mode, lang=lang, limit=limit, min_score=min_score)
+
+
 def main():
     """
     TR: Ana Streamlit uygulaması.
@@ -228,12 +621,21 @@ def main():
     """
     
     # Load database
-    terms, metadata = load_database()
+    db = load_database()
     
-    if not terms:
+    if not db or not db["en"]:
         st.error(":x: Veritabanı bulunamadı! Lütfen önce `python convert.py` komutunu çalıştırın.")
         st.stop()
     
+    metadata = db["metadata"]
+    total_terms = len(db["en"])
+    
+    # Per-session generator; random terms are drawn as indices into the
+    # term columns and only materialized for display
+    if 'rng' not in st.session_state:
+        st.session_state.rng = random.Random()
+    rng = st.session_state.rng
+    
     # Header
     st.title(":books: TBD Bilişim Terimleri Sözlüğü")
     st.markdown("---")
@@ -246,7 +648,7 @@ def main():
         st.subheader(":bar_chart: İstatistikler")
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Toplam Terim", f"{len(terms):,}")
+            st.metric("Toplam Terim", f"{total_terms:,}")
         with col2:
             st.metric("Versiyon", metadata.get('version', 'N/A'))
         
@@ -300,7 +702,7 @@ def main():
         # Random term
         st.subheader(":game_die: Rastgele Terim")
         if st.button("Rastgele Terim Getir", use_container_width=True):
-            random_term = random.choice(terms)
+            random_term = get_term(db, rng.randrange(total_terms))
             st.session_state.random_term = random_term
         
         if 'random_term' in st.session_state:
@@ -324,11 +726,11 @@ def main():
                 results = st.session_state.search_results
                 
                 if export_format == "JSON":
-                    json_str = json.dumps(
-                        [{"en": r[0]["en"], "tr": r[0]["tr"]} for r in results],
-                        ensure_ascii=False,
-                        indent=2
-                    )
+                    export = [{"en": r[0]["en"], "tr": r[0]["tr"]} for r in results]
+                    if orjson is not None:
+                        json_str = orjson.dumps(export, option=orjson.OPT_INDENT_2).decode()
+                    else:
+                        json_str = json.dumps(export, ensure_ascii=False, indent=2)
                     st.download_button(
                         label=":arrow_down: JSON İndir",
                         data=json_str,
@@ -336,9 +738,11 @@ def main():
                         mime="application/json"
                     )
                 elif export_format == "CSV":
-                    csv_str = "English,Turkish\n"
-                    for r in results:
-                        csv_str += f'"{r[0]["en"]}","{r[0]["tr"]}"\n'
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+                    writer.writerow(("English", "Turkish"))
+                    writer.writerows((r[0]["en"], r[0]["tr"]) for r in results)
+                    csv_str = buffer.getvalue()
                     st.download_button(
                         label=":arrow_down: CSV İndir",
                         data=csv_str,
@@ -346,9 +750,7 @@ def main():
                         mime="text/csv"
                     )
                 elif export_format == "TXT":
-                    txt_str = ""
-                    for r in results:
-                        txt_str += f"{r[0]['en']} -> {r[0]['tr']}\n"
+                    txt_str = "".join(f"{r[0]['en']} -> {r[0]['tr']}\n" for r in results)
                     st.download_button(
                         label=":arrow_down: TXT İndir",
                         data=txt_str,
@@ -373,8 +775,7 @@ def main():
         # Search button
         if search_query:
             with st.spinner("Aranıyor..."):
-                results = search_terms(
-                    terms,
+                results = cached_search_terms(
                     search_query,
                     mode=search_mode,
                     lang=search_lang,
@@ -445,7 +846,7 @@ def main():
             
             # Show some sample terms
             st.subheader(":pushpin: Örnek Terimler")
-            sample_terms = random.sample(terms, min(5, len(terms)))
+            sample_terms = [get_term(db, idx) for idx in rng.sample(range(total_terms), min(5, total_terms))]
             
             for term in sample_terms:
                 with st.container():